@@ -0,0 +1,66 @@
+"""Benchmark dispatch speed of generated match code on wide case sets.
+
+Compares the decision tree emitted by ``CodeGenerator`` with the naive
+sequential chain (``match_strategy: chain``).
+
+    python -m benchmarks.bench_match_dispatch
+"""
+import random
+import timeit
+import warnings
+
+from src.codeGenerator import CodeGenerator, MatchWarning
+
+WIDTHS = (8, 32, 64)
+
+
+def wide_cases(width):
+    """Tuples and lists of lengths 1-4 keyed by a literal tag, then a fallback."""
+    cases = []
+    for i in range(width):
+        arity = i % 4 + 1
+        kind = "TUPLE" if i % 2 else "LIST"
+        items = [{"type": "LITERAL", "value": i // 8}]
+        items += [{"type": "CAPTURE", "name": f"v{j}"} for j in range(1, arity)]
+        guard = "v1 is not None" if arity > 1 and i % 3 == 0 else None
+        cases.append({"pattern": {"type": kind, "items": items}, "guard": guard, "body": [f"return {i}"]})
+    cases.append({"pattern": {"type": "WILDCARD"}, "body": ["return -1"]})
+    return cases
+
+
+def build(strategy, cases):
+    generator = CodeGenerator({"generation": {"match_strategy": strategy}})
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", MatchWarning)
+        lines = generator.generate_match({"type": "MATCH", "subject": "subject", "cases": cases})
+    source = "def dispatch(subject):\n" + "".join(f"    {line}\n" for line in lines) + "    return None\n"
+    namespace = {}
+    exec(source, namespace)
+    return namespace["dispatch"]
+
+
+def subjects(width, count=1000):
+    rng = random.Random(0)
+    values = []
+    for _ in range(count):
+        arity = rng.randint(1, 4)
+        value = [rng.randint(0, width // 8)] + [rng.choice([None, 1])] * (arity - 1)
+        values.append(tuple(value) if rng.random() < 0.5 else value)
+    return values
+
+
+def main():
+    print(f"{'cases':>6} {'chain (us)':>11} {'tree (us)':>10} {'speedup':>8}")
+    for width in WIDTHS:
+        cases = wide_cases(width)
+        chain, tree = build("chain", cases), build("decision_tree", cases)
+        values = subjects(width)
+        assert [chain(v) for v in values] == [tree(v) for v in values]
+        chain_time = min(timeit.repeat(lambda: [chain(v) for v in values], number=20, repeat=3))
+        tree_time = min(timeit.repeat(lambda: [tree(v) for v in values], number=20, repeat=3))
+        per_call = 1e6 / (20 * len(values))
+        print(f"{width:>6} {chain_time * per_call:>11.3f} {tree_time * per_call:>10.3f} {chain_time / tree_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Benchmark symbol resolution at increasing scope nesting depths.
+
+Compares the scoped ``SymbolTable`` with copying a plain dict on every
+scope entry, which is what ``Transformer.symbol_table`` used to require.
+Both start from the same prebuilt global environment, built outside the
+timed region: a fresh dict copy or ``SymbolTable`` per run.
+
+``nested`` only enters scopes and resolves names. ``interleaved`` also
+expands a nested body (push, bind, pop) and binds a local in the current
+scope at every level, which is the usual hygienic expander pattern.
+
+    python -m benchmarks.bench_symbol_table
+"""
+import time
+import timeit
+
+from src.symbol_table import SymbolTable
+
+DEPTHS = (1, 10, 100, 1000)
+GLOBALS = [f"g{i}" for i in range(500)]
+USED = GLOBALS[::50]
+LOCALS = [f"local{i}" for i in range(max(DEPTHS))]
+
+
+def nested_with_dict_copies(base, depth):
+    table = base
+    for level in range(depth):
+        table = dict(table)
+        table[LOCALS[level]] = level
+        for name in USED:
+            table[name]
+
+
+def nested_with_scopes(table, depth):
+    resolve = table.resolve
+    for level in range(depth):
+        table.push_scope()
+        table.define(LOCALS[level], level)
+        for name in USED:
+            resolve(name)
+    for _ in range(depth):
+        table.pop_scope()
+
+
+def interleaved_with_dict_copies(base, depth):
+    table = base
+    for level in range(depth):
+        body = dict(table)
+        body["tmp"] = level
+        table[LOCALS[level]] = level
+        table = dict(table)
+        for name in USED:
+            table[name]
+            table[LOCALS[level]]
+
+
+def interleaved_with_scopes(table, depth):
+    resolve = table.resolve
+    for level in range(depth):
+        table.push_scope()
+        table.define("tmp", level)
+        table.pop_scope()
+        table.define(LOCALS[level], level)
+        table.push_scope()
+        for name in USED:
+            resolve(name)
+            resolve(LOCALS[level])
+    for _ in range(depth):
+        table.pop_scope()
+
+
+def fresh_table():
+    table = SymbolTable()
+    for i, name in enumerate(GLOBALS):
+        table.define(name, i)
+    return table
+
+
+def measure(workload, make_env, depth, number):
+    """Best of three, per call; environments are built outside the timing."""
+    best = float("inf")
+    for _ in range(3):
+        envs = [make_env() for _ in range(number)]
+        start = time.perf_counter()
+        for env in envs:
+            workload(env, depth)
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+
+def main():
+    base = {name: i for i, name in enumerate(GLOBALS)}
+    workloads = (
+        # The nested dict workload never writes to ``base``, so it is shared.
+        ("nested", nested_with_dict_copies, lambda: base, nested_with_scopes),
+        ("interleaved", interleaved_with_dict_copies, lambda: dict(base), interleaved_with_scopes),
+    )
+
+    print(f"{'workload':>12} {'depth':>6} {'dict copy (ms)':>16} {'scoped (ms)':>12} {'speedup':>8}")
+    for label, copying, make_dict, scoped in workloads:
+        for depth in DEPTHS:
+            number = max(5, 500 // depth)
+            copy_time = measure(copying, make_dict, depth, number)
+            scoped_time = measure(scoped, fresh_table, depth, number)
+            print(
+                f"{label:>12} {depth:>6} {copy_time * 1e3:>16.4f} "
+                f"{scoped_time * 1e3:>12.4f} {copy_time / scoped_time:>7.2f}x"
+            )
+
+    table = fresh_table()
+    print(f"\n{'depth':>6} {'resolve (ns)':>13} {'dict[name] (ns)':>16}")
+    for depth in DEPTHS:
+        for _ in range(depth):
+            table.push_scope()
+        number = 200000
+        resolve_time = min(timeit.repeat(lambda: table.resolve("g0"), number=number, repeat=3))
+        dict_time = min(timeit.repeat(lambda: base["g0"], number=number, repeat=3))
+        print(f"{depth:>6} {resolve_time / number * 1e9:>13.0f} {dict_time / number * 1e9:>16.0f}")
+        for _ in range(depth):
+            table.pop_scope()
+
+
+if __name__ == "__main__":
+    main()
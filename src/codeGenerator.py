@@ -1,11 +1,321 @@
+import warnings
+from typing import Dict, List, Optional, Set, Tuple
+
+from .symbol_table import SymbolTable
+
+INDENT = "    "
+IRREFUTABLE = {"WILDCARD", "CAPTURE"}
+SEQUENCE_TYPES = {"TUPLE": "tuple", "LIST": "list"}
+# Bounds on the decision tree, which can grow exponentially when wildcard
+# rows are copied into every branch. Past either bound the chain is used.
+MAX_TREE_DEPTH = 40
+TREE_SIZE_FACTOR = 8
+
+
+class _TreeTooLarge(Exception):
+    pass
+
+
+class MatchWarning(UserWarning):
+    """Issued at generation time for unreachable or non-exhaustive cases."""
+
+
 class CodeGenerator:
-    def __init__(self):
+    def __init__(self, config: Optional[Dict] = None):
+        self.config = config or {}
+        self.match_strategy = self.config.get("generation", {}).get("match_strategy", "decision_tree")
+        self.symbols = SymbolTable()
         self.generated_code = ""
 
     def generate(self, ast):
         for statement in ast:
             if statement["type"] == "DEFINE":
                 self.generated_code += f"{statement['var_name']} = {statement['value']}\n"
+            elif statement["type"] == "MATCH":
+                self.generated_code += "".join(line + "\n" for line in self.generate_match(statement))
+
+    def generate_match(self, statement) -> List[str]:
+        """Compile a MATCH node into lines of Python source.
+
+        A MATCH node is ``{"type": "MATCH", "subject": expr, "cases": [...]}``
+        where each case has a ``pattern``, an optional ``guard`` expression and
+        a ``body`` list of source lines. Patterns are WILDCARD, CAPTURE
+        (``name``), LITERAL (``value``), TUPLE or LIST (``items``).
+        """
+        subject = self.symbols.gensym("m").name
+        lines = [f"{subject} = {statement['subject']}"]
+        cases = statement["cases"]
+        if self.match_strategy not in ("chain", "decision_tree"):
+            raise ValueError(f"Unknown match strategy: {self.match_strategy}")
+        chain: List[str] = []
+        self._emit_chain(subject, cases, chain)
+        if self.match_strategy == "chain":
+            return lines + chain
+
+        case_var = self.symbols.gensym("c").name
+        tree = [f"{case_var} = -1"]
+        rows = [([case["pattern"]], (), index) for index, case in enumerate(cases)]
+        reached: Set[int] = set()
+        self._case_var = case_var
+        self._tree_budget = TREE_SIZE_FACTOR * len(chain)
+        try:
+            exhaustive = self._emit_tree([subject], rows, cases, 0, tree, reached)
+        except _TreeTooLarge:
+            lines += chain
+            reached, exhaustive = self._chain_coverage(cases)
+        else:
+            lines += tree
+            self._emit_dispatch(sorted(reached), cases, exhaustive, lines)
+
+        for index in range(len(cases)):
+            if index not in reached:
+                warnings.warn(f"Unreachable case {index} in match on {statement['subject']}", MatchWarning)
+        if not exhaustive:
+            warnings.warn(f"Non-exhaustive match on {statement['subject']}", MatchWarning)
+        return lines
+
+    # Decision tree compilation. Each row is (patterns, bindings, case index),
+    # with one pattern per occurrence in ``occs``. A column is tested once and
+    # the rows are specialised by constructor, so sequence lengths and literal
+    # discriminants are never re-examined and destructuring is shared. Leaves
+    # only store the case index; each body is emitted once by the dispatch.
+
+    def _emit_tree(self, occs, rows, cases, depth, lines, reached) -> bool:
+        if depth > MAX_TREE_DEPTH or len(lines) > self._tree_budget:
+            raise _TreeTooLarge
+        indent = INDENT * depth
+        if not rows:
+            lines.append(f"{indent}pass")
+            return False
+
+        patterns = rows[0][0]
+        col = next((i for i, p in enumerate(patterns) if p["type"] not in IRREFUTABLE), None)
+        if col is None:
+            return self._emit_leaves(occs, rows, cases, depth, lines, reached)
+
+        occ = occs[col]
+        literals: List[Tuple] = []
+        sequences: Dict[str, List[Tuple]] = {}
+        for row_patterns, _, _ in rows:
+            key = self._constructor(row_patterns[col])
+            if key is None:
+                continue
+            if key[0] == "LITERAL":
+                if key not in literals:
+                    literals.append(key)
+            elif key not in sequences.setdefault(key[0], []):
+                sequences[key[0]].append(key)
+
+        # Identity tests (None/True/False) go first: a subject that reaches an
+        # equality branch is then never one of them, so each branch only has
+        # to admit the rows whose own test passes for its key value.
+        literals.sort(key=lambda key: len(key) == 2)
+        exhaustive = True
+        keyword = "if"
+        for key in literals:
+            lines.append(f"{indent}{keyword} {self._literal_test(occ, key[-1])}:")
+            specialised = self._specialise(rows, col, occ, key, 0)
+            exhaustive &= self._emit_tree(occs[:col] + occs[col + 1:], specialised, cases, depth + 1, lines, reached)
+            keyword = "elif"
+
+        for kind, keys in sequences.items():
+            lines.append(f"{indent}{keyword} isinstance({occ}, {SEQUENCE_TYPES[kind]}):")
+            inner = indent + INDENT
+            length = self.symbols.gensym("n").name
+            lines.append(f"{inner}{length} = len({occ})")
+            length_keyword = "if"
+            for key in keys:
+                arity = key[1]
+                lines.append(f"{inner}{length_keyword} {length} == {arity}:")
+                items = [self.symbols.gensym("s").name for _ in range(arity)]
+                if items:
+                    lines.append(f"{inner}{INDENT}{', '.join(items)}{',' if arity == 1 else ''} = {occ}")
+                specialised = self._specialise(rows, col, occ, key, arity)
+                sub_occs = occs[:col] + items + occs[col + 1:]
+                exhaustive &= self._emit_tree(sub_occs, specialised, cases, depth + 2, lines, reached)
+                length_keyword = "elif"
+            exhaustive &= self._emit_default(occs, rows, col, cases, depth + 1, lines, reached)
+            keyword = "elif"
+
+        exhaustive &= self._emit_default(occs, rows, col, cases, depth, lines, reached)
+        return exhaustive
+
+    def _emit_leaves(self, occs, rows, cases, depth, lines, reached) -> bool:
+        """Emit a run of irrefutable rows as flat, guarded assignments."""
+        indent = INDENT * depth
+        for position, (patterns, bindings, index) in enumerate(rows):
+            if any(p["type"] not in IRREFUTABLE for p in patterns):
+                lines.append(f"{indent}if {self._case_var} < 0:")
+                return self._emit_tree(occs, rows[position:], cases, depth + 1, lines, reached)
+            inner = indent
+            if position:
+                lines.append(f"{indent}if {self._case_var} < 0:")
+                inner += INDENT
+            bindings += tuple((p["name"], occ) for p, occ in zip(patterns, occs) if p["type"] == "CAPTURE")
+            for name, occ in bindings:
+                lines.append(f"{inner}{name} = {occ}")
+            reached.add(index)
+            guard = cases[index].get("guard")
+            if not guard:
+                lines.append(f"{inner}{self._case_var} = {index}")
+                return True
+            lines.append(f"{inner}if {guard}:")
+            lines.append(f"{inner}{INDENT}{self._case_var} = {index}")
+        return False
+
+    def _emit_dispatch(self, indices, cases, exhaustive, lines):
+        """Run the selected body, bisecting on the case index."""
+        depth = 0
+        if not exhaustive and indices:
+            lines.append(f"if {self._case_var} >= 0:")
+            depth = 1
+        self._emit_bisect(indices, cases, depth, lines)
+
+    def _emit_bisect(self, indices, cases, depth, lines):
+        if len(indices) == 1:
+            self._emit_body(cases[indices[0]]["body"], depth, lines)
+            return
+        if not indices:
+            return
+        middle = len(indices) // 2
+        lines.append(f"{INDENT * depth}if {self._case_var} < {indices[middle]}:")
+        self._emit_bisect(indices[:middle], cases, depth + 1, lines)
+        lines.append(f"{INDENT * depth}else:")
+        self._emit_bisect(indices[middle:], cases, depth + 1, lines)
+
+    def _emit_default(self, occs, rows, col, cases, depth, lines, reached) -> bool:
+        occ = occs[col]
+        default = []
+        for patterns, bindings, index in rows:
+            pattern = patterns[col]
+            if pattern["type"] not in IRREFUTABLE:
+                continue
+            if pattern["type"] == "CAPTURE":
+                bindings += ((pattern["name"], occ),)
+            default.append((patterns[:col] + patterns[col + 1:], bindings, index))
+        if not default:
+            return False
+        lines.append(f"{INDENT * depth}else:")
+        return self._emit_tree(occs[:col] + occs[col + 1:], default, cases, depth + 1, lines, reached)
+
+    def _specialise(self, rows, col, occ, key, arity):
+        specialised = []
+        for patterns, bindings, index in rows:
+            pattern = patterns[col]
+            if pattern["type"] in IRREFUTABLE:
+                if pattern["type"] == "CAPTURE":
+                    bindings += ((pattern["name"], occ),)
+                expanded = [{"type": "WILDCARD"}] * arity
+            elif key[0] == "LITERAL":
+                if pattern["type"] != "LITERAL" or not self._literal_matches(pattern["value"], key[-1]):
+                    continue
+                expanded = []
+            elif self._constructor(pattern) == key:
+                expanded = list(pattern["items"])
+            else:
+                continue
+            specialised.append((patterns[:col] + expanded + patterns[col + 1:], bindings, index))
+        return specialised
+
+    @staticmethod
+    def _constructor(pattern) -> Optional[Tuple]:
+        kind = pattern["type"]
+        if kind == "LITERAL":
+            value = pattern["value"]
+            # Keyed by type as well so True/1/1.0 and False/0 stay apart.
+            if value is None or isinstance(value, bool):
+                return ("LITERAL", type(value), value)
+            return ("LITERAL", value)
+        if kind in SEQUENCE_TYPES:
+            return (kind, len(pattern["items"]))
+        if kind in IRREFUTABLE:
+            return None
+        raise ValueError(f"Unknown pattern type: {kind}")
+
+    def _chain_coverage(self, cases) -> Tuple[Set[int], bool]:
+        """Reachability for the chain: cases not covered by an earlier one.
+
+        A subject of any other type defeats every refutable pattern, so only
+        an unguarded wildcard or capture makes a match exhaustive.
+        """
+        reached: Set[int] = set()
+        for index, case in enumerate(cases):
+            if not any(
+                not earlier.get("guard") and self._covers(earlier["pattern"], case["pattern"])
+                for earlier in cases[:index]
+            ):
+                reached.add(index)
+        exhaustive = any(
+            index in reached and not case.get("guard") and case["pattern"]["type"] in IRREFUTABLE
+            for index, case in enumerate(cases)
+        )
+        return reached, exhaustive
+
+    def _covers(self, pattern, other) -> bool:
+        if pattern["type"] in IRREFUTABLE:
+            return True
+        if other["type"] in IRREFUTABLE:
+            return False
+        if pattern["type"] == "LITERAL":
+            return other["type"] == "LITERAL" and self._literal_matches(pattern["value"], other["value"])
+        return (
+            self._constructor(pattern) == self._constructor(other)
+            and all(self._covers(p, q) for p, q in zip(pattern["items"], other["items"]))
+        )
+
+    # Sequential chain, one structural test per case. Kept as the reference
+    # behaviour for the decision tree and selectable via ``match_strategy``.
+
+    def _emit_chain(self, subject, cases, lines):
+        matched = self.symbols.gensym("matched").name
+        lines.append(f"{matched} = False")
+        for case in cases:
+            tests: List[str] = []
+            bindings: List[Tuple[str, str]] = []
+            self._chain_tests(case["pattern"], subject, tests, bindings)
+            condition = " and ".join([f"not {matched}"] + tests)
+            lines.append(f"if {condition}:")
+            for name, occ in bindings:
+                lines.append(f"{INDENT}{name} = {occ}")
+            depth = 1
+            if case.get("guard"):
+                lines.append(f"{INDENT}if {case['guard']}:")
+                depth = 2
+            lines.append(f"{INDENT * depth}{matched} = True")
+            self._emit_body(case["body"], depth, lines)
+
+    def _chain_tests(self, pattern, occ, tests, bindings):
+        kind = pattern["type"]
+        if kind == "CAPTURE":
+            bindings.append((pattern["name"], occ))
+        elif kind == "LITERAL":
+            tests.append(self._literal_test(occ, pattern["value"]))
+        elif kind in SEQUENCE_TYPES:
+            items = pattern["items"]
+            tests.append(f"isinstance({occ}, {SEQUENCE_TYPES[kind]})")
+            tests.append(f"len({occ}) == {len(items)}")
+            for i, item in enumerate(items):
+                self._chain_tests(item, f"{occ}[{i}]", tests, bindings)
+        elif kind != "WILDCARD":
+            raise ValueError(f"Unknown pattern type: {kind}")
+
+    @staticmethod
+    def _literal_test(occ, value) -> str:
+        if value is None or isinstance(value, bool):
+            return f"{occ} is {value!r}"
+        return f"{occ} == {value!r}"
+
+    @staticmethod
+    def _literal_matches(value, subject) -> bool:
+        """Evaluate ``_literal_test`` for a known subject value."""
+        if value is None or isinstance(value, bool):
+            return subject is value
+        return subject == value
+
+    @staticmethod
+    def _emit_body(body, depth, lines):
+        for line in body or ["pass"]:
+            lines.append(f"{INDENT * depth}{line}")
 
     def save(self, output_file):
         with open(output_file, "w") as f:
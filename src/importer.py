@@ -0,0 +1,115 @@
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import marshal
+import os
+import sys
+from typing import Optional
+
+from .codeGenerator import CodeGenerator
+from .lexer import Lexer
+from .parser import Parser
+from .transformer import Transformer
+
+DSL_SUFFIX = ".dsl"
+BYTECODE_SUFFIX = ".dsl.pyc"
+# Mixed into the source hash so bytecode written by an older pipeline is
+# recompiled instead of reused; bump it whenever generated code changes.
+PIPELINE_VERSION = b"metaportia-dsl-1"
+# Same header flags as a checked hash-based .pyc (PEP 552).
+_HASH_BASED_CHECKED = (0b11).to_bytes(4, "little")
+
+
+def compile_dsl(source: str) -> str:
+    """Run DSL source through the full pipeline and return Python source."""
+    tokens = Lexer().tokenize(source)
+    ast = Parser(tokens).parse()
+    ast = Transformer().transform(ast)
+    generator = CodeGenerator()
+    generator.generate(ast)
+    return generator.generated_code
+
+
+def cache_from_dsl(path: str) -> str:
+    """Return the ``__pycache__`` path used for a ``.dsl`` file.
+
+    The name is kept distinct from the one a sibling ``.py`` file would use.
+    """
+    cached = importlib.util.cache_from_source(path)
+    return cached[: -len(".pyc")] + BYTECODE_SUFFIX
+
+
+class DSLLoader(importlib.machinery.SourceFileLoader):
+    """Load a ``.dsl`` module, caching its bytecode like a hash-based .pyc."""
+
+    def source_to_code(self, data, path, *, _optimize=-1):
+        try:
+            python_source = compile_dsl(importlib.util.decode_source(data))
+        except ValueError as exc:
+            # Lexer and Parser report errors as ValueError without a location.
+            error = SyntaxError(str(exc))
+            error.filename = path
+            raise error from exc
+        return compile(python_source, path, "exec", dont_inherit=True, optimize=_optimize)
+
+    def get_code(self, fullname):
+        source_path = self.get_filename(fullname)
+        bytecode_path = cache_from_dsl(source_path)
+        data = self.get_data(source_path)
+        source_hash = importlib.util.source_hash(PIPELINE_VERSION + data)
+
+        try:
+            cached = self.get_data(bytecode_path)
+        except OSError:
+            cached = None
+        if (
+            cached is not None
+            and cached[:4] == importlib.util.MAGIC_NUMBER
+            and cached[4:8] == _HASH_BASED_CHECKED
+            and cached[8:16] == source_hash
+        ):
+            try:
+                return marshal.loads(cached[16:])
+            except (EOFError, ValueError, TypeError):
+                pass
+
+        code = self.source_to_code(data, source_path)
+        if not sys.dont_write_bytecode:
+            payload = bytearray(importlib.util.MAGIC_NUMBER)
+            payload += _HASH_BASED_CHECKED
+            payload += source_hash
+            payload += marshal.dumps(code)
+            self.set_data(bytecode_path, bytes(payload))
+        return code
+
+
+class DSLFinder(importlib.abc.MetaPathFinder):
+    """Meta path finder that resolves ``import foo`` to ``foo.dsl``."""
+
+    def find_spec(self, fullname, path=None, target=None) -> Optional[importlib.machinery.ModuleSpec]:
+        name = fullname.rpartition(".")[2]
+        for entry in sys.path if path is None else path:
+            if not isinstance(entry, str):
+                continue
+            filename = os.path.join(entry or os.getcwd(), name + DSL_SUFFIX)
+            if os.path.isfile(filename):
+                loader = DSLLoader(fullname, filename)
+                spec = importlib.util.spec_from_file_location(fullname, filename, loader=loader)
+                spec.cached = cache_from_dsl(filename)
+                spec.has_location = True
+                return spec
+        return None
+
+
+def install() -> DSLFinder:
+    """Register the ``.dsl`` finder after the standard path finders."""
+    for finder in sys.meta_path:
+        if isinstance(finder, DSLFinder):
+            return finder
+    finder = DSLFinder()
+    sys.meta_path.append(finder)
+    return finder
+
+
+def uninstall():
+    sys.meta_path[:] = [f for f in sys.meta_path if not isinstance(f, DSLFinder)]
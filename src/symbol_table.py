@@ -0,0 +1,213 @@
+from itertools import count
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+_MISSING = object()
+_ABSENT = object()
+_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+class Symbol:
+    """An identifier compared by identity rather than by spelling.
+
+    Symbols created through ``Symbol.intern`` are shared per name, so lookups
+    hash a pointer instead of a string. Gensyms are never interned: a user
+    identifier with the same spelling is still a different symbol.
+    """
+
+    __slots__ = ("name", "version")
+    _interned: Dict[str, "Symbol"] = {}
+
+    def __init__(self, name: str):
+        self.name = name
+        # Bumped whenever this symbol is bound in a frame that has children,
+        # which invalidates the lookups those children cached for it.
+        self.version = 0
+
+    @classmethod
+    def intern(cls, name: Union[str, "Symbol"]) -> "Symbol":
+        if isinstance(name, Symbol):
+            return name
+        symbol = cls._interned.get(name)
+        if symbol is None:
+            symbol = cls._interned[name] = cls(name)
+        return symbol
+
+    def __repr__(self):
+        return f"Symbol({self.name})"
+
+    def __str__(self):
+        return self.name
+
+
+_interned = Symbol._interned
+
+
+class Scope:
+    """A frame of bindings chained to its enclosing frame.
+
+    Frames are shared, never copied: entering a scope allocates one empty
+    frame and leaving it just drops the reference. Each frame memoises the
+    bindings it resolved from its ancestors, keyed by symbol version, so
+    repeated lookups from a captured frame do not walk the whole chain.
+    Frames are only written through ``SymbolTable.define``, which keeps the
+    table's view of the current scope in sync.
+    """
+
+    __slots__ = ("parent", "depth", "bindings", "_cache", "_shared")
+
+    def __init__(self, parent: Optional["Scope"] = None):
+        self.parent = parent
+        self.depth = parent.depth + 1 if parent is not None else 0
+        self.bindings: Dict[Symbol, Any] = {}
+        self._cache: Dict[Symbol, Tuple[int, Any]] = {}
+        self._shared = False
+
+    def child(self) -> "Scope":
+        self._shared = True
+        return Scope(self)
+
+    def lookup(self, symbol: Symbol, default: Any = _MISSING) -> Any:
+        value = self.bindings.get(symbol, _MISSING)
+        if value is not _MISSING:
+            return value
+        version = symbol.version
+        cached = self._cache.get(symbol)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        frame = self.parent
+        while frame is not None:
+            value = frame.bindings.get(symbol, _MISSING)
+            if value is not _MISSING:
+                break
+            cached = frame._cache.get(symbol)
+            if cached is not None and cached[0] == version:
+                value = cached[1]
+                break
+            frame = frame.parent
+
+        if value is _MISSING:
+            if default is _MISSING:
+                raise KeyError(symbol.name)
+            return default
+        self._cache[symbol] = (version, value)
+        return value
+
+
+class SymbolTable:
+    """Scoped symbol table for macro expansion.
+
+    The current scope is mirrored in a flat view, so ``resolve`` is a single
+    dict lookup at any depth. ``push_scope`` is O(1); ``define`` records what
+    it shadowed and ``pop_scope`` undoes only that, so both are O(1) per
+    binding. ``snapshot`` returns the current frame so an expansion can
+    capture its environment without copying it; restoring a frame that is
+    not an ancestor of the current one rebuilds the view from its chain.
+    String keys are interned, so the table can still be used like the plain
+    dict it replaces.
+    """
+
+    def __init__(self):
+        self.scope = Scope()
+        self._view: Dict[Symbol, Any] = {}
+        # One entry per open frame, innermost last: the (symbol, shadowed view
+        # value, symbol version after the define) triples pop_scope undoes. A
+        # changed version means an ancestor was rebound in the meantime.
+        self._undo: List[List[Tuple[Symbol, Any, int]]] = [[]]
+        self._gensym_counter = count(1)
+
+    def push_scope(self) -> Scope:
+        self.scope = scope = self.scope.child()
+        self._undo.append([])
+        return scope
+
+    def pop_scope(self) -> Scope:
+        parent = self.scope.parent
+        if parent is None:
+            raise ValueError("Cannot pop the global scope")
+        view = self._view
+        for symbol, previous, version in self._undo.pop():
+            if symbol.version != version:
+                previous = parent.lookup(symbol, _ABSENT)
+            if previous is _MISSING or previous is _ABSENT:
+                del view[symbol]
+            else:
+                view[symbol] = previous
+        self.scope = parent
+        return parent
+
+    def snapshot(self) -> Scope:
+        return self.scope
+
+    def restore(self, scope: Scope):
+        frame = self.scope
+        while frame is not None and frame is not scope:
+            frame = frame.parent
+        if frame is scope:
+            while self.scope is not scope:
+                self.pop_scope()
+            return
+        chain = []
+        frame = scope
+        while frame is not None:
+            chain.append(frame)
+            frame = frame.parent
+        view: Dict[Symbol, Any] = {}
+        self._undo = []
+        for frame in reversed(chain):
+            undo = []
+            for symbol, value in frame.bindings.items():
+                undo.append((symbol, view.get(symbol, _MISSING), symbol.version))
+                view[symbol] = value
+            self._undo.append(undo)
+        self._view = view
+        self.scope = scope
+
+    @property
+    def depth(self) -> int:
+        return self.scope.depth
+
+    def define(self, name: Union[str, Symbol], value: Any) -> Symbol:
+        symbol = Symbol.intern(name)
+        scope = self.scope
+        if scope._shared:
+            symbol.version += 1
+        bindings = scope.bindings
+        if symbol not in bindings:
+            self._undo[-1].append((symbol, self._view.get(symbol, _MISSING), symbol.version))
+        bindings[symbol] = value
+        self._view[symbol] = value
+        return symbol
+
+    def resolve(self, name: Union[str, Symbol], default: Any = _MISSING) -> Any:
+        try:
+            return self._view[_interned[name] if name.__class__ is str else name]
+        except KeyError:
+            if default is _MISSING:
+                raise KeyError(name) from None
+            return default
+
+    def gensym(self, hint: str = "g") -> Symbol:
+        """Return a fresh, uninterned symbol named from a base-36 counter."""
+        n = next(self._gensym_counter)
+        digits = ""
+        while n:
+            n, rem = divmod(n, 36)
+            digits = _DIGITS[rem] + digits
+        return Symbol(f"__{hint}_{digits}")
+
+    def __getitem__(self, name: Union[str, Symbol]) -> Any:
+        return self.resolve(name)
+
+    def __setitem__(self, name: Union[str, Symbol], value: Any):
+        self.define(name, value)
+
+    def __contains__(self, name: Union[str, Symbol]) -> bool:
+        return self.resolve(name, _ABSENT) is not _ABSENT
+
+    def get(self, name: Union[str, Symbol], default: Any = None) -> Any:
+        return self.resolve(name, default)
+
+    def __iter__(self) -> Iterator[str]:
+        for symbol in self._view:
+            yield symbol.name
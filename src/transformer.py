@@ -1,11 +1,15 @@
-from typing import Dict
-from .parser import ASTNode
+from typing import Dict, List
+from .symbol_table import SymbolTable
+
+ASTNode = List[Dict]
 
 class Transformer:
     def __init__(self):
-        self.symbol_table = {}
-        
+        self.symbol_table = SymbolTable()
+
     def transform(self, ast: ASTNode) -> ASTNode:
         """Transform AST for optimization and analysis."""
-        # Implementation here
-        pass
\ No newline at end of file
+        for statement in ast:
+            if statement["type"] == "DEFINE":
+                self.symbol_table.define(statement["var_name"], statement["value"])
+        return ast
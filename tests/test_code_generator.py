@@ -1,8 +1,105 @@
+import warnings
 import pytest
-from src.codeGenerator import CodeGenerator
+from src.codeGenerator import CodeGenerator, MatchWarning
 
 def test_generate_code():
     config = {}
     generator = CodeGenerator(config)
-    # Test implementation here
-    pass
\ No newline at end of file
+    generator.generate([{"type": "DEFINE", "var_name": "x", "value": 5}])
+    assert generator.generated_code == "x = 5\n"
+
+def lit(value):
+    return {"type": "LITERAL", "value": value}
+
+def cap(name):
+    return {"type": "CAPTURE", "name": name}
+
+WILD = {"type": "WILDCARD"}
+
+CASES = [
+    {"pattern": {"type": "TUPLE", "items": [lit(0), cap("x")]}, "guard": "x > 0", "body": ["result = ('zero', x)"]},
+    {"pattern": {"type": "TUPLE", "items": [cap("x"), cap("y")]}, "body": ["result = ('pair', x, y)"]},
+    {"pattern": {"type": "LIST", "items": [lit("a"), WILD, cap("z")]}, "body": ["result = ('list', z)"]},
+    {"pattern": lit(None), "body": ["result = 'none'"]},
+    {"pattern": cap("other"), "body": ["result = ('other', other)"]},
+]
+
+def run(strategy, cases, subject):
+    generator = CodeGenerator({"generation": {"match_strategy": strategy}})
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", MatchWarning)
+        generator.generate([{"type": "MATCH", "subject": "subject", "cases": cases}])
+    namespace = {"subject": subject, "result": "unmatched"}
+    exec(generator.generated_code, namespace)
+    return namespace["result"]
+
+LITERAL_CASES = [
+    [{"pattern": lit(True), "body": ["result = 0"]}, {"pattern": lit(1), "body": ["result = 1"]}],
+    [{"pattern": lit(1), "body": ["result = 0"]}, {"pattern": lit(True), "body": ["result = 1"]}],
+    [{"pattern": lit(False), "body": ["result = 0"]}, {"pattern": lit(0), "body": ["result = 1"]}],
+    [{"pattern": lit(0), "body": ["result = 0"]}, {"pattern": lit(False), "body": ["result = 1"]}],
+    [{"pattern": lit(1), "body": ["result = 0"]}, {"pattern": lit(1.0), "body": ["result = 1"]}],
+    [
+        {"pattern": lit(True), "body": ["result = 0"]},
+        {"pattern": lit(1.0), "body": ["result = 1"]},
+        {"pattern": WILD, "body": ["result = 2"]},
+    ],
+]
+
+@pytest.mark.parametrize("cases,subject", [(CASES, subject) for subject in [
+    (0, 1), (0, -1), (1, 2), ["a", 1, 2], ["b", 1, 2], [1], None, 3, (), (1, 2, 3),
+]] + [(cases, subject) for cases in LITERAL_CASES for subject in [True, False, 1, 0, 1.0, 0.0, None]])
+def test_decision_tree_matches_chain(cases, subject):
+    assert run("decision_tree", cases, subject) == run("chain", cases, subject)
+
+def test_decision_tree_shares_length_test():
+    cases = [{"pattern": {"type": "TUPLE", "items": [lit(i), cap("x")]}, "body": ["pass"]} for i in range(10)]
+    cases.append({"pattern": WILD, "body": ["pass"]})
+    generator = CodeGenerator()
+    generator.generate([{"type": "MATCH", "subject": "s", "cases": cases}])
+    assert generator.generated_code.count("len(") == 1
+
+def test_unreachable_and_non_exhaustive_cases_warn():
+    cases = [
+        {"pattern": {"type": "TUPLE", "items": [cap("x"), cap("y")]}, "body": ["pass"]},
+        {"pattern": {"type": "TUPLE", "items": [lit(1), lit(2)]}, "body": ["pass"]},
+    ]
+    with pytest.warns(MatchWarning) as record:
+        CodeGenerator().generate([{"type": "MATCH", "subject": "s", "cases": cases}])
+    messages = [str(w.message) for w in record]
+    assert "Unreachable case 1 in match on s" in messages
+    assert "Non-exhaustive match on s" in messages
+
+def test_many_guarded_arms_stay_flat():
+    cases = [
+        {"pattern": {"type": "TUPLE", "items": [cap("x"), cap("y")]}, "guard": f"x == {i}", "body": [f"result = {i}"]}
+        for i in range(150)
+    ]
+    assert run("decision_tree", cases, (149, 0)) == 149
+    assert run("decision_tree", cases, (150, 0)) == "unmatched"
+
+def test_tree_size_is_bounded_by_chain():
+    def generated_lines(strategy, cases):
+        generator = CodeGenerator({"generation": {"match_strategy": strategy}})
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", MatchWarning)
+            generator.generate([{"type": "MATCH", "subject": "s", "cases": cases}])
+        return generator.generated_code.count("\n")
+
+    for width in (4, 8, 16):
+        cases = [
+            {
+                "pattern": {"type": "TUPLE", "items": [lit(i) if j == i else WILD for j in range(width)]},
+                "guard": "True",
+                "body": [f"result = {i}"],
+            }
+            for i in range(width)
+        ]
+        assert generated_lines("decision_tree", cases) <= 8 * generated_lines("chain", cases)
+        assert run("decision_tree", cases, tuple(range(width))) == run("chain", cases, tuple(range(width)))
+
+def test_case_bodies_are_emitted_once():
+    generator = CodeGenerator()
+    generator.generate([{"type": "MATCH", "subject": "s", "cases": CASES}])
+    for case in CASES:
+        assert generator.generated_code.count(case["body"][0]) == 1
@@ -0,0 +1,50 @@
+import importlib
+import os
+import sys
+import pytest
+from src import importer
+
+@pytest.fixture
+def dsl_path(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    importer.install()
+    yield tmp_path
+    importer.uninstall()
+    sys.modules.pop("dsl_sample", None)
+
+def test_import_dsl_module(dsl_path):
+    (dsl_path / "dsl_sample.dsl").write_text("DEFINE x = 5")
+    module = importlib.import_module("dsl_sample")
+    assert module.x == 5
+    assert module.__cached__ == importer.cache_from_dsl(str(dsl_path / "dsl_sample.dsl"))
+    assert os.path.exists(module.__cached__)
+
+def test_warm_import_skips_pipeline(dsl_path, monkeypatch):
+    source = dsl_path / "dsl_sample.dsl"
+    source.write_text("DEFINE x = 5")
+    importlib.import_module("dsl_sample")
+    del sys.modules["dsl_sample"]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("pipeline should not run on a warm import")
+
+    monkeypatch.setattr(importer, "compile_dsl", fail)
+    assert importlib.import_module("dsl_sample").x == 5
+
+def test_changed_source_is_recompiled(dsl_path):
+    source = dsl_path / "dsl_sample.dsl"
+    source.write_text("DEFINE x = 5")
+    importlib.import_module("dsl_sample")
+    del sys.modules["dsl_sample"]
+    source.write_text("DEFINE x = 7")
+    assert importlib.import_module("dsl_sample").x == 7
+
+def test_malformed_dsl_raises_syntax_error_with_path(dsl_path):
+    source = dsl_path / "dsl_sample.dsl"
+    source.write_text("DEFINE x = 5 ???")
+    with pytest.raises(SyntaxError) as excinfo:
+        importlib.import_module("dsl_sample")
+    assert excinfo.value.filename == str(source)
+    assert source.name in str(excinfo.value)
+    assert "Unexpected token" in str(excinfo.value)
@@ -0,0 +1,79 @@
+import pytest
+from src.symbol_table import Symbol, SymbolTable
+
+def test_intern_returns_same_symbol():
+    assert Symbol.intern("x") is Symbol.intern("x")
+
+def test_scopes_shadow_and_restore():
+    table = SymbolTable()
+    table.define("x", 1)
+    table.push_scope()
+    table.define("x", 2)
+    assert table["x"] == 2
+    table.pop_scope()
+    assert table["x"] == 1
+    with pytest.raises(ValueError):
+        table.pop_scope()
+
+def test_lookup_cache_sees_later_outer_definitions():
+    table = SymbolTable()
+    table.define("x", 1)
+    outer = table.snapshot()
+    for _ in range(50):
+        table.push_scope()
+    inner = table.snapshot()
+    assert table["x"] == 1
+    table.restore(outer)
+    table.define("x", 2)
+    table.restore(inner)
+    assert table["x"] == 2
+    assert "y" not in table
+
+def test_gensym_is_hygienic():
+    table = SymbolTable()
+    first, second = table.gensym(), table.gensym()
+    assert first.name != second.name
+    assert first.name.isidentifier()
+    table.define(first, "hidden")
+    assert first.name not in table
+
+def test_interleaved_push_pop_define_resolves_at_depth():
+    table = SymbolTable()
+    table.define("outer", 0)
+    expected = [{"outer": 0}]
+    for level in range(200):
+        table.push_scope()
+        table.define("tmp", level)
+        table.define("outer", -level)
+        assert table["outer"] == -level
+        table.pop_scope()
+        table.define(f"local{level}", level)
+        expected[-1][f"local{level}"] = level
+        if level % 3 == 0:
+            table.define("outer", level)
+            expected[-1]["outer"] = level
+        table.push_scope()
+        expected.append({})
+        merged = {k: v for frame in expected for k, v in frame.items()}
+        assert table["outer"] == merged["outer"]
+        assert table[f"local{level}"] == level
+        assert "tmp" not in table
+    for _ in range(200):
+        table.pop_scope()
+    assert table["outer"] == 0
+    assert "local5" not in table
+
+def test_captured_scope_sees_rebinding_of_one_symbol():
+    table = SymbolTable()
+    table.define("x", 1)
+    table.define("y", 1)
+    outer = table.snapshot()
+    for _ in range(20):
+        table.push_scope()
+    inner = table.snapshot()
+    assert inner.lookup(Symbol.intern("x")) == 1
+    assert inner.lookup(Symbol.intern("y")) == 1
+    table.restore(outer)
+    table.define("x", 2)
+    assert inner.lookup(Symbol.intern("x")) == 2
+    assert inner.lookup(Symbol.intern("y")) == 1
@@ -3,5 +3,6 @@ from src.transformer import Transformer
 
 def test_transform():
     transformer = Transformer()
-    # Test implementation here
-    pass
\ No newline at end of file
+    ast = [{"type": "DEFINE", "var_name": "x", "value": 5}]
+    assert transformer.transform(ast) is ast
+    assert transformer.symbol_table["x"] == 5